@@ -1,6 +1,53 @@
 import os.path as op
 import            os
 import            gzip
+import            shutil
+import concurrent.futures as cf
+
+# If you need faster compression, the
+# third-party isal library (pip install
+# isal) provides isal.igzip.IGzipFile,
+# an accelerated drop-in replacement
+# for gzip.GzipFile.
+
+
+def compress_one(infile):
+    """Compresses the given `.nii` file with gzip, replacing it with a
+    `.nii.gz` file.
+
+    :arg infile: `.nii` file to compress.
+    """
+
+    # Note: this function is run in separate
+    # processes by compress_all, so it must be
+    # defined in an importable module (i.e. a
+    # .py file). On macOS and Windows, the pool
+    # will not work if this function is defined
+    # in a Jupyter notebook cell.
+
+    outfile = '{}.gz'.format(infile)
+
+    # Stream the file through the
+    # compressor in 1MB chunks, rather
+    # than loading it into memory in
+    # one go. Compression level 1 is
+    # much faster than the default, and
+    # gives similar results on image data.
+    #
+    # We give the output file a 1MB
+    # buffer (the default is 8KB), so
+    # that compressed data is written
+    # in large blocks. Setting mtime=0
+    # means that the output does not
+    # depend on when it was created.
+    with open(infile,  'rb')                        as inf, \
+         open(outfile, 'wb', buffering=1024 * 1024) as rawf, \
+         gzip.GzipFile(fileobj=rawf,
+                       mode='wb',
+                       compresslevel=1,
+                       mtime=0)                     as outf:
+        shutil.copyfileobj(inf, outf, 1024 * 1024)
+    os.remove(infile)
 
 
 def compress_all(dirname):
@@ -10,15 +57,24 @@ def compress_all(dirname):
     :arg dirname: Directory to scan for `.nii` files.
     """
 
+    # Build a list of all the
+    # files we need to compress
+    infiles = []
     for root, dirs, files in os.walk(dirname):
-
         uncmpfiles = [f for f in files if f.endswith('.nii')]
+        infiles.extend([op.join(root, uf) for uf in uncmpfiles])
 
-        infiles  = [op.join(root, uf)  for  uf  in uncmpfiles]
-        outfiles = ['{}.gz'.format(inf) for inf in infiles]
+    # Nothing to do - don't
+    # bother starting a pool
+    if len(infiles) == 0:
+        return
 
-        for infile, outfile in zip(infiles, outfiles):
-            with open(     infile,  'rb') as inf, \
-                 gzip.open(outfile, 'wb') as outf:
-                outf.write(inf.read())
-            os.remove(infile)
+    # Each file can be compressed
+    # independently, so we can use
+    # all of our CPU cores at once.
+    # Each file is sent to a worker
+    # on its own (the default chunk
+    # size of 1), so that all of the
+    # workers are kept busy.
+    with cf.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(compress_one, infiles))
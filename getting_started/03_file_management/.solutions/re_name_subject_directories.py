@@ -1,7 +1,5 @@
 import os.path as op
-import            glob
-import            shutil
-import numpy   as np
+import            os
 
 
 def rename_subject_dirs(dirname):
@@ -14,26 +12,23 @@ def rename_subject_dirs(dirname):
     :arg dirname: Data set directory.
     """
 
-    # get a list of all
-    # subject directories
-    subjdirs = list(glob.glob(op.join(dirname, 'subj_*')))
-
-    # get a list of subject IDs
-    subjids = [int(sd.split('_')[1]) for sd in subjdirs]
+    # get the ID and path of every
+    # subject directory - os.scandir
+    # gives us the name and type of
+    # each entry in one pass
+    with os.scandir(dirname) as it:
+        subjdirs = [(int(e.name.split('_')[1]), e.path) for e in it
+                    if e.is_dir(follow_symlinks=False) and
+                    e.name.startswith('subj_')]
 
     # figure out the maximmum
     # number of digits we need
-    ndigits = int(np.ceil(np.log10(max(subjids) + 1)))
-
-    # create a format string
-    # which will pad an ID with
-    # the required number of zeros
-    fmtstr = 'subj_{{:0{}d}}'.format(ndigits)
-
-    # generate new subject
-    # directory names
-    newsubjdirs = [op.join(dirname, fmtstr.format(sid)) for sid in subjids]
-
-    # rename each subject dir
-    for subjdir, newsubjdir in zip(subjdirs, newsubjdirs):
-        shutil.move(subjdir, newsubjdir)
+    ndigits = len(str(max(sid for sid, _ in subjdirs)))
+
+    # rename each subject dir, padding
+    # its ID with the required number
+    # of zeros - they are all in the
+    # same directory, so os.rename
+    # is all we need
+    for sid, subjdir in subjdirs:
+        os.rename(subjdir, op.join(dirname, f'subj_{sid:0{ndigits}d}'))
@@ -1,6 +1,5 @@
 import os.path as op
 import            os
-import            glob
 
 
 def rename_subject_files(subjdir, group):
@@ -27,20 +26,25 @@ def rename_subject_files(subjdir, group):
     subjid = op.basename(subjdir)
     subjid = subjid.split('_')[1]
 
-    # Get a list of all nifti images
-    # in the subject directory.
-    imgfiles = list(glob.glob(op.join(subjdir, '*.nii')) +
-                    glob.glob(op.join(subjdir, '*.nii.gz')))
-
-    # Generate new file names
-    # for all of these images
-    newimgfiles = ['{}_subj_{}_{}'.format(group, subjid, op.basename(imgf))
-                   for imgf in imgfiles]
-    newimgfiles = [op.join(subjdir, imgf) for imgf in newimgfiles]
+    # Get a list of all nifti images in
+    # the subject directory. We use a
+    # single os.scandir call, rather than
+    # one glob call for each extension.
+    # Like glob, we ignore hidden files
+    # (e.g. macOS ._t1.nii files).
+    with os.scandir(subjdir) as it:
+        imgfiles = [e for e in it
+                    if e.is_file() and
+                    not e.name.startswith('.') and
+                    e.name.endswith(('.nii', '.nii.gz'))]
+
+    # The prefix is the same
+    # for every image file
+    prefix = f'{group}_subj_{subjid}_'
 
     # Rename all the images
-    for imgfile, newimgfile in zip(imgfiles, newimgfiles):
-        os.rename(imgfile, newimgfile)
+    for e in imgfiles:
+        os.rename(e.path, op.join(subjdir, prefix + e.name))
 
 
 def rename_all_subject_files(dirname):
@@ -52,19 +56,26 @@ def rename_all_subject_files(dirname):
                   subject.
     """
 
-    # get a list of all
-    # group directories
-    groupdirs = glob.glob(op.join(dirname, '*'))
-    groupdirs = [gdir for gdir in groupdirs if op.isdir(gdir)]
-
-    for groupdir in groupdirs:
+    # get a list of all group
+    # directories, and their names.
+    # os.scandir tells us whether each
+    # entry is a directory without
+    # having to call op.isdir on it.
+    # Like glob, we ignore hidden
+    # directories (e.g. .ipynb_checkpoints).
+    with os.scandir(dirname) as it:
+        groups = [(e.name, e.path) for e in it
+                  if e.is_dir(follow_symlinks=False) and
+                  not e.name.startswith('.')]
 
-        # get the group name
-        group = op.basename(op.normpath(groupdir))
+    for group, groupdir in groups:
 
         # get the list of subject
         # directories in this group
-        subjdirs = glob.glob(op.join(groupdir, 'subj_*'))
+        with os.scandir(groupdir) as it:
+            subjdirs = [e.path for e in it
+                        if e.is_dir(follow_symlinks=False) and
+                        e.name.startswith('subj_')]
 
         # apply rename_subject_files
         # to each subject dir
@@ -1,7 +1,5 @@
 import            os
 import os.path as op
-import            glob
-import            shutil
 
 
 def reorganise_data_set(dirname, groupLabels, groups):
@@ -15,10 +13,12 @@ def reorganise_data_set(dirname, groupLabels, groups):
                       by a sequence of subject IDs.
     """
 
-    # Get lists of subject directories
-    # and corresponding subject IDs
-    subjdirs = list(glob.glob(op.join(dirname, 'subj_*')))
-    subjids  = [int(sd.split('_')[1]) for sd in subjdirs]
+    # Build a dictionary so we can look
+    # up the directory for a subject ID
+    with os.scandir(dirname) as it:
+        idtodir = {int(e.name.split('_')[1]) : e.path for e in it
+                   if e.is_dir(follow_symlinks=False) and
+                   e.name.startswith('subj_')}
 
     # For each group
     for glabel, group in zip(groupLabels, groups):
@@ -32,5 +32,5 @@ def reorganise_data_set(dirname, groupLabels, groups):
 
             # Lookup the subject directory,
             # and move it into the group dir
-            subjdir = subjdirs[subjids.index(sid)]
-            shutil.move(subjdir, groupdir)
+            subjdir = idtodir[sid]
+            os.rename(subjdir, op.join(groupdir, op.basename(subjdir)))
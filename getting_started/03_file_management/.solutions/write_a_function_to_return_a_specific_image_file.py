@@ -2,6 +2,20 @@ import os.path as op
 import            os
 import            re
 import            glob
+import            functools
+
+
+@functools.lru_cache()
+def subject_pattern(subjID):
+    """Returns a compiled regex which can be used to identify the
+    directory for the specified `subjID`. The regex is only compiled
+    once for each subject ID.
+
+    :arg subjID: Subject ID
+    :returns:    A compiled regex which matches `subj_[id]`, where `[id]`
+                 is `subjID`, optionally padded with zeros.
+    """
+    return re.compile(f'subj_(0*{subjID})')
 
 
 
@@ -25,7 +39,7 @@ def get_image(dirname, group, subjID, modality):
     # Define a regex which we can
     # use to identify the appropriate
     # subject directory
-    subjpat   = re.compile('subj_(0*{})'.format(subjID))
+    subjpat   = subject_pattern(subjID)
     padsubjID = None
 
     # Look for the relevant subject
@@ -71,36 +85,42 @@ def get_image_nogroup(dirname, subjID, modality):
     # Define a regex which we can
     # use to identify the appropriate
     # subject directory
-    subjpat = re.compile('subj_(0*{})'.format(subjID))
+    subjpat = subject_pattern(subjID)
 
     # Look for the relevant subject
-    # directory. When we find it, we
-    # store the zero-padded version
-    # of the subject ID, so we can
-    # use it to construct the final
-    # file name.
-    subjdir   = None
-    padsubjID = None
-    for root, dirs, files in os.walk(dirname):
+    # directory. When we find one, we
+    # use the zero-padded version of
+    # the subject ID, and the name of
+    # the group directory, to construct
+    # the final file name. We only stop
+    # searching once we have found a
+    # file which actually exists, as
+    # there may be other directories
+    # with the same name elsewhere
+    # (e.g. derivatives/subj_03).
+    for root, dirs, files in os.walk(dirname, followlinks=False):
         for d in dirs:
             match = subjpat.fullmatch(d)
-            if match is not None:
-                subjdir   = op.join(root, d)
-                padsubjID = match.groups(0)[0]
-
-    if subjdir is None:
-        return None
+            if match is None:
+                continue
 
-    # Get the name of the group
-    # this subject is in
-    group = op.basename(op.dirname(subjdir))
-
-    # Construct and return
-    # the relevant file name
-    fname = '{}_subj_{}_{}.nii.gz'.format(group, padsubjID, modality)
-    fname = op.join(subjdir, fname)
-
-    if op.exists(fname):
-        return fname
-    else:
-        return None
+            group     = op.basename(root)
+            padsubjID = match.groups(0)[0]
+            fname     = '{}_subj_{}_{}.nii.gz'.format(
+                group, padsubjID, modality)
+            fname     = op.join(root, d, fname)
+
+            if op.exists(fname):
+                return fname
+
+        # Modifying dirs in-place stops
+        # os.walk from descending into
+        # the directories we remove. We
+        # don't need to look inside other
+        # subject directories, or inside
+        # hidden directories (e.g. .git).
+        dirs[:] = [d for d in dirs
+                   if not (d.startswith('subj_') or d.startswith('.'))]
+
+    # Could not find the file
+    return None
@@ -3,27 +3,33 @@ def nifti_splitext(path, exts=None):
     prefix and suffix components.
 
     :arg path: Path to split
-    :arg exts: List of recognised file extensions. Defaults to
-               `['.nii', '.nii.gz']`, but can be overridden.
+    :arg exts: Sequence of recognised file extensions. Defaults to
+               `('.nii.gz', '.nii')`, but can be overridden. If more than
+               one extension matches, the longest one is used, regardless
+               of the order in which they are given (e.g. `'.nii.gz'`
+               is chosen over `'.gz'`).
 
     :returns:  A tuple containing:
                 - The part of `path` before the extension
                 - The extension
     """
+
+    # The default extensions are already
+    # in longest-first order, so we only
+    # need to sort extensions which are
+    # passed in by the caller.
     if exts is None:
-        exts = ['.nii', '.nii.gz']
+        exts = ('.nii.gz', '.nii')
+    else:
+        exts = sorted(exts, key=len, reverse=True)
 
-    # Try and find a suffix match
-    extMatches = [path.endswith(ext) for ext in exts]
+    # Try and find a suffix match, testing
+    # the longest extensions first. We
+    # return as soon as we find a match.
+    for ext in exts:
+        if path.endswith(ext):
+            return path[:-len(ext)], ext
 
     # No match - there is
     # no supported extension
-    if not any(extMatches):
-        return path, ''
-
-    # Otherwise split the path
-    # into its base and its extension
-    extIdx = extMatches.index(True)
-    extLen = len(exts[extIdx])
-
-    return path[:-extLen], path[-extLen:]
+    return path, ''
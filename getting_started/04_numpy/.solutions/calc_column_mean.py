@@ -1,10 +1,20 @@
 #!/usr/bin/env python
-import numpy as np
+import sys
+import numpy  as np
+import pandas as pd
 
-data     = np.loadtxt('04_numpy/2d_array.txt', comments='%')
+# pandas.read_csv is much faster than
+# np.loadtxt for large text files
+data     = pd.read_csv('04_numpy/2d_array.txt',
+                       comment='%',
+                       sep=r'\s+',
+                       header=None,
+                       dtype=np.float64).to_numpy()
 colmeans = data.mean(axis=0)
-msg      = ''.join([chr(int(round(m))) for m in colmeans])
+msg      = ''.join(map(chr, colmeans.round().astype(int)))
 
+# Write the means out one line at a time,
+# rather than building one big string
 print('Column means')
-print('\n'.join(['{}: {}'.format(i, m) for i, m in enumerate(colmeans)]))
+sys.stdout.writelines(f'{i}: {m}\n' for i, m in enumerate(colmeans))
 print('Secret message:', msg)
@@ -1,28 +1,85 @@
 #!/usr/bin/env python
 
+import                 os
+import os.path      as op
 import numpy        as np
 import numpy.linalg as npla
 
 def concat(*xforms):
     """Combines the given matrices (returns the dot product)."""
 
-    result = xforms[0]
+    # multi_dot requires at least two
+    # matrices, and for exactly two it
+    # is no better than the @ operator
+    if len(xforms) == 1:
+        return xforms[0]
+    elif len(xforms) == 2:
+        return xforms[0] @ xforms[1]
 
-    for i in range(1, len(xforms)):
-        result = np.dot(result, xforms[i])
+    # multi_dot chooses the cheapest
+    # order in which to multiply the
+    # matrices, and does the work
+    # in a single call
+    return npla.multi_dot(xforms)
 
-    return result
 
+def transform(xform, coords):
+    """Transform the given coordinates with the given affine. `coords` may
+    be a single `(x, y, z)` coordinate, or a `(N, 3)` array of
+    coordinates.
+    """
+    return coords @ xform[:3, :3].T + xform[:3, 3]
 
-def transform(xform, coord):
-    """Transform the given coordinates with the given affine. """
-    return np.dot(xform[:3, :3], coord) + xform[:3, 3]
 
+def load_affine(path, dtype=np.float32):
+    """Load an affine from the given text file. The affine is converted
+    into a `.npy` file the first time it is loaded with a given `dtype`,
+    and memory-mapped from that file thereafter. The `.npy` file is
+    re-created if the text file is modified. If the `.npy` file cannot be
+    written (e.g. because the data directory is read-only), the text file
+    is loaded directly.
 
-s1func2struc = np.loadtxt('04_numpy/xfms/subj1/example_func2highres.mat')
-s1struc2std  = np.loadtxt('04_numpy/xfms/subj1/highres2standard.mat')
-s2func2struc = np.loadtxt('04_numpy/xfms/subj2/example_func2highres.mat')
-s2struc2std  = np.loadtxt('04_numpy/xfms/subj2/highres2standard.mat')
+    Affines are loaded as 32 bit floats by default, which is more than
+    enough precision for transforming voxel coordinates, and matches the
+    type of the coordinates we are transforming.
+    """
+    # The .npy file is saved in the
+    # requested dtype, so that it can be
+    # memory-mapped without being copied.
+    # The dtype is part of the file name,
+    # so different dtypes never share a
+    # cache file.
+    dtype = np.dtype(dtype)
+    npy   = '{}.{}.npy'.format(path, dtype.name)
+
+    try:
+        # We write to a temporary file, and
+        # then move it into place, so that an
+        # interrupted run (or two runs at the
+        # same time) can never leave behind a
+        # partially written .npy file.
+        if not op.exists(npy) or op.getmtime(path) > op.getmtime(npy):
+            tmp = '{}.{}.tmp'.format(npy, os.getpid())
+            try:
+                with open(tmp, 'wb') as f:
+                    np.save(f, np.loadtxt(path, dtype=dtype))
+                os.replace(tmp, npy)
+            finally:
+                if op.exists(tmp):
+                    os.remove(tmp)
+        return np.load(npy, mmap_mode='r')
+
+    # Can't write or read the .npy file
+    # (or it is corrupt) - load the
+    # text file instead
+    except (OSError, ValueError):
+        return np.loadtxt(path, dtype=dtype)
+
+
+s1func2struc = load_affine('04_numpy/xfms/subj1/example_func2highres.mat')
+s1struc2std  = load_affine('04_numpy/xfms/subj1/highres2standard.mat')
+s2func2struc = load_affine('04_numpy/xfms/subj2/example_func2highres.mat')
+s2struc2std  = load_affine('04_numpy/xfms/subj2/highres2standard.mat')
 
 s1func2std    = concat(s1struc2std, s1func2struc)
 s2func2std    = concat(s2struc2std, s2func2struc)
@@ -36,9 +93,11 @@ testcoords = np.array([[ 0,   0,  0],
                        [-5, -20, 10],
                        [20,  25, 60]], dtype=np.float32)
 
+# transform all of the
+# coordinates in one go
+xcoords = transform(s1func2s2func, testcoords)
 
-for c in testcoords:
-    xc = transform(s1func2s2func, c)
+for c, xc in zip(testcoords, xcoords):
     c  = '{:6.2f} {:6.2f} {:6.2f}'.format(*c)
     xc = '{:6.2f} {:6.2f} {:6.2f}'.format(*xc)
     print('Transform: [{}] -> [{}])'.format(c, xc))